@@ -1,16 +1,36 @@
 """Base model provider interface and data classes."""
 
+import bisect
+import functools
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of model names memoized per provider by _resolve_model_name()
+_RESOLVED_NAME_CACHE_SIZE = 64
+# Maximum number of capability objects memoized per provider by _get_capabilities_cached()
+_CAPABILITIES_CACHE_SIZE = 64
 
-class ProviderType(Enum):
-    """Supported model provider types."""
+# Cached debug check for hot paths; call refresh_log_level() after (re)configuring logging
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+
+def refresh_log_level() -> None:
+    """Re-read whether debug logging is enabled for this module."""
+    global _DEBUG
+    _DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+
+class ProviderType(str, Enum):
+    """Supported model provider types.
+
+    Mixes in str so hashing and equality (e.g. registry dict keys) use the fast str implementations.
+    """
 
     GOOGLE = "google"
     OPENAI = "openai"
@@ -20,35 +40,54 @@ class ProviderType(Enum):
     DIAL = "dial"
 
 
-class TemperatureConstraint(ABC):
-    """Abstract base class for temperature constraints."""
+class TemperatureConstraint:
+    """Base class for temperature constraints.
+
+    A plain class rather than an ABC so isinstance checks and construction avoid ABCMeta;
+    subclasses must override every method. Constraints are immutable: canonical instances
+    are shared across models, so subclasses assign their slots in __init__ via object.__setattr__.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-    @abstractmethod
     def validate(self, temperature: float) -> bool:
         """Check if temperature is valid."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_corrected_value(self, temperature: float) -> float:
         """Get nearest valid temperature."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_description(self) -> str:
         """Get human-readable description of constraint."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_default(self) -> float:
         """Get model's default temperature."""
-        pass
+        raise NotImplementedError
+
+    def get_range(self) -> tuple[float, float]:
+        """Get the (min, max) temperatures allowed by this constraint."""
+        raise NotImplementedError
 
 
 class FixedTemperatureConstraint(TemperatureConstraint):
     """For models that only support one temperature value (e.g., O3)."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: float):
-        self.value = value
+        object.__setattr__(self, "value", value)
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copy and pickle work despite the immutable __setattr__
+        return (type(self), (self.value,))
 
     def validate(self, temperature: float) -> bool:
         return abs(temperature - self.value) < 1e-6  # Handle floating point precision
@@ -62,14 +101,22 @@ class FixedTemperatureConstraint(TemperatureConstraint):
     def get_default(self) -> float:
         return self.value
 
+    def get_range(self) -> tuple[float, float]:
+        return (self.value, self.value)
+
 
 class RangeTemperatureConstraint(TemperatureConstraint):
     """For models supporting continuous temperature ranges."""
 
+    __slots__ = ("min_temp", "max_temp", "default_temp")
+
     def __init__(self, min_temp: float, max_temp: float, default: float = None):
-        self.min_temp = min_temp
-        self.max_temp = max_temp
-        self.default_temp = default or (min_temp + max_temp) / 2
+        object.__setattr__(self, "min_temp", min_temp)
+        object.__setattr__(self, "max_temp", max_temp)
+        object.__setattr__(self, "default_temp", default or (min_temp + max_temp) / 2)
+
+    def __reduce__(self):
+        return (type(self), (self.min_temp, self.max_temp, self.default_temp))
 
     def validate(self, temperature: float) -> bool:
         return self.min_temp <= temperature <= self.max_temp
@@ -83,26 +130,61 @@ class RangeTemperatureConstraint(TemperatureConstraint):
     def get_default(self) -> float:
         return self.default_temp
 
+    def get_range(self) -> tuple[float, float]:
+        return (self.min_temp, self.max_temp)
+
 
 class DiscreteTemperatureConstraint(TemperatureConstraint):
     """For models supporting only specific temperature values."""
 
-    def __init__(self, allowed_values: list[float], default: float = None):
-        self.allowed_values = sorted(allowed_values)
-        self.default_temp = default or allowed_values[len(allowed_values) // 2]
+    __slots__ = ("allowed_values", "default_temp")
+
+    def __init__(self, allowed_values: Sequence[float], default: float = None):
+        values = tuple(allowed_values)
+        # Skip the sort for the common case of an already-ordered table
+        if not all(values[i] <= values[i + 1] for i in range(len(values) - 1)):
+            values = tuple(sorted(values))
+        object.__setattr__(self, "allowed_values", values)
+        object.__setattr__(self, "default_temp", default if default is not None else values[len(values) // 2])
+
+    def __reduce__(self):
+        return (type(self), (self.allowed_values, self.default_temp))
 
     def validate(self, temperature: float) -> bool:
-        return any(abs(temperature - val) < 1e-6 for val in self.allowed_values)
+        # Nearest allowed value is a bisect away; NaN and infinities compare unequal and fail
+        return abs(self.get_corrected_value(temperature) - temperature) < 1e-6  # Handle floating point precision
 
     def get_corrected_value(self, temperature: float) -> float:
-        return min(self.allowed_values, key=lambda x: abs(x - temperature))
+        # allowed_values is sorted, so the nearest value is one of the two bisect neighbours
+        index = bisect.bisect_left(self.allowed_values, temperature)
+        if index == 0:
+            return self.allowed_values[0]
+        if index == len(self.allowed_values):
+            return self.allowed_values[-1]
+        lower = self.allowed_values[index - 1]
+        upper = self.allowed_values[index]
+        return lower if temperature - lower <= upper - temperature else upper
 
     def get_description(self) -> str:
-        return f"Supports temperatures: {self.allowed_values}"
+        return f"Supports temperatures: {list(self.allowed_values)}"
 
     def get_default(self) -> float:
         return self.default_temp
 
+    def get_range(self) -> tuple[float, float]:
+        # allowed_values is sorted
+        return (self.allowed_values[0], self.allowed_values[-1])
+
+
+# Shared constraint instances for the canonical configurations. Constraints are immutable,
+# so every model using the same configuration can share one.
+# Fixed temperature models (O3/O4) only support temperature=1.0
+_FIXED_CONSTRAINT = FixedTemperatureConstraint(1.0)
+# For models with specific allowed values - using common OpenAI values as default
+_DISCRETE_CONSTRAINT = DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0, 1.5, 2.0], 0.7)
+# Default range constraint (for "range" or None)
+_DEFAULT_RANGE_CONSTRAINT = RangeTemperatureConstraint(0.0, 2.0, 0.7)
+
 
 def create_temperature_constraint(constraint_type: str) -> TemperatureConstraint:
     """Create temperature constraint object from configuration string.
@@ -111,20 +193,17 @@ def create_temperature_constraint(constraint_type: str) -> TemperatureConstraint
         constraint_type: Type of constraint ("fixed", "range", "discrete")
 
     Returns:
-        TemperatureConstraint object based on configuration
+        Shared TemperatureConstraint object based on configuration
     """
     if constraint_type == "fixed":
-        # Fixed temperature models (O3/O4) only support temperature=1.0
-        return FixedTemperatureConstraint(1.0)
+        return _FIXED_CONSTRAINT
     elif constraint_type == "discrete":
-        # For models with specific allowed values - using common OpenAI values as default
-        return DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0, 1.5, 2.0], 0.7)
+        return _DISCRETE_CONSTRAINT
     else:
-        # Default range constraint (for "range" or None)
-        return RangeTemperatureConstraint(0.0, 2.0, 0.7)
+        return _DEFAULT_RANGE_CONSTRAINT
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelCapabilities:
     """Capabilities and constraints for a specific model."""
 
@@ -155,39 +234,36 @@ class ModelCapabilities:
     is_custom: bool = False  # Whether this model requires custom API endpoints
 
     # Temperature constraint object - preferred way to define temperature limits
-    temperature_constraint: TemperatureConstraint = field(
-        default_factory=lambda: RangeTemperatureConstraint(0.0, 2.0, 0.7)
-    )
+    temperature_constraint: TemperatureConstraint = _DEFAULT_RANGE_CONSTRAINT
+
+    # Set by proxy providers when returning conservative defaults for unknown models
+    _is_generic: bool = field(default=False, init=False, repr=False, compare=False)
 
     # Backward compatibility property for existing code
     @property
     def temperature_range(self) -> tuple[float, float]:
         """Backward compatibility for existing code that uses temperature_range."""
-        if isinstance(self.temperature_constraint, RangeTemperatureConstraint):
-            return (self.temperature_constraint.min_temp, self.temperature_constraint.max_temp)
-        elif isinstance(self.temperature_constraint, FixedTemperatureConstraint):
-            return (self.temperature_constraint.value, self.temperature_constraint.value)
-        elif isinstance(self.temperature_constraint, DiscreteTemperatureConstraint):
-            values = self.temperature_constraint.allowed_values
-            return (min(values), max(values))
-        return (0.0, 2.0)  # Fallback
+        return self.temperature_constraint.get_range()
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResponse:
     """Response from a model provider."""
 
+    # usage and metadata stay real per-instance dicts: providers always pass both, and tools
+    # store them in conversation turns, so a shared read-only default would not be serializable.
     content: str
     usage: dict[str, int] = field(default_factory=dict)  # input_tokens, output_tokens, total_tokens
     model_name: str = ""
     friendly_name: str = ""  # Human-friendly name like "Gemini" or "OpenAI"
     provider: ProviderType = ProviderType.GOOGLE
     metadata: dict[str, Any] = field(default_factory=dict)  # Provider-specific metadata
+    total_tokens: int = 0  # Defaults to usage["total_tokens"] when not given explicitly
 
-    @property
-    def total_tokens(self) -> int:
-        """Get total tokens used."""
-        return self.usage.get("total_tokens", 0)
+    def __post_init__(self):
+        """Resolve total_tokens from usage once instead of on every access."""
+        if not self.total_tokens and self.usage:
+            self.total_tokens = self.usage.get("total_tokens", 0)
 
 
 class ModelProvider(ABC):
@@ -200,12 +276,47 @@ class ModelProvider(ABC):
         """Initialize the provider with API key and optional configuration."""
         self.api_key = api_key
         self.config = kwargs
+        # Bounded because proxy providers return generic capabilities for any client-supplied name
+        self._capabilities_cache = functools.lru_cache(maxsize=_CAPABILITIES_CACHE_SIZE)(self._lookup_capabilities)
+        # Restriction service and policy the cached capabilities were looked up under
+        self._capabilities_policy: Optional[tuple[Any, Any]] = None
+        # Bounded because model names come straight from client requests, unknown ones included
+        self._resolved_name_cache = functools.lru_cache(maxsize=_RESOLVED_NAME_CACHE_SIZE)(self._lookup_model_name)
+        # Index of canonical model names for constant-time membership checks
+        self._known_names: frozenset[str] = frozenset(self.SUPPORTED_MODELS)
+        # Memoized model listings, see invalidate_model_cache()
+        self._model_listing_cache: Optional[tuple[list[str], dict[str, list[str]]]] = None
+        self._list_all_cache: Optional[list[str]] = None
 
     @abstractmethod
     def get_capabilities(self, model_name: str) -> ModelCapabilities:
         """Get capabilities for a specific model."""
         pass
 
+    def _get_capabilities_cached(self, model_name: str) -> ModelCapabilities:
+        """Get capabilities for a model, memoized per model name.
+
+        Capability objects are static per model, so repeated lookups on hot paths
+        (temperature resolution, parameter validation) only pay for get_capabilities() once.
+        Failed lookups are not cached and will raise again on the next call.
+
+        get_capabilities() also enforces the restriction policy, so the cache is dropped
+        whenever the restriction service or its policy is replaced.
+        """
+        from utils.model_restrictions import get_restriction_service
+
+        restriction_service = get_restriction_service()
+        policy = self._capabilities_policy
+        if policy is None or policy[0] is not restriction_service or policy[1] is not restriction_service.restrictions:
+            self._capabilities_cache.cache_clear()
+            self._capabilities_policy = (restriction_service, restriction_service.restrictions)
+
+        return self._capabilities_cache(model_name)
+
+    def _lookup_capabilities(self, model_name: str) -> ModelCapabilities:
+        """Get capabilities for a model without caching."""
+        return self.get_capabilities(model_name)
+
     @abstractmethod
     def generate_content(
         self,
@@ -241,10 +352,13 @@ class ModelProvider(ABC):
         """Get the provider type."""
         pass
 
-    @abstractmethod
     def validate_model_name(self, model_name: str) -> bool:
-        """Validate if the model name is supported by this provider."""
-        pass
+        """Validate if the model name is supported by this provider.
+
+        Default implementation checks the name, or its resolved alias target, against
+        SUPPORTED_MODELS. Providers that enforce restriction policies should override this.
+        """
+        return model_name in self._known_names or self._resolve_model_name(model_name) in self._known_names
 
     def get_effective_temperature(self, model_name: str, requested_temperature: float) -> Optional[float]:
         """Get the effective temperature to use for a model given a requested temperature.
@@ -252,7 +366,7 @@ class ModelProvider(ABC):
         This method handles:
         - Models that don't support temperature (returns None)
         - Fixed temperature models (returns the fixed value)
-        - Clamping to min/max range for models with constraints
+        - Correcting to the nearest value allowed by the model's temperature constraint
 
         Args:
             model_name: The model to get temperature for
@@ -262,42 +376,42 @@ class ModelProvider(ABC):
             The effective temperature to use, or None if temperature shouldn't be passed
         """
         try:
-            capabilities = self.get_capabilities(model_name)
-
-            # Check if model supports temperature at all
-            if not capabilities.supports_temperature:
-                return None
-
-            # Get temperature range
-            min_temp, max_temp = capabilities.temperature_range
-
-            # Clamp to valid range
-            if requested_temperature < min_temp:
-                logger.debug(f"Clamping temperature from {requested_temperature} to {min_temp} for model {model_name}")
-                return min_temp
-            elif requested_temperature > max_temp:
-                logger.debug(f"Clamping temperature from {requested_temperature} to {max_temp} for model {model_name}")
-                return max_temp
-            else:
-                return requested_temperature
-
-        except Exception as e:
-            logger.debug(f"Could not determine effective temperature for {model_name}: {e}")
+            capabilities = self._get_capabilities_cached(model_name)
+        except (ValueError, KeyError, AttributeError) as e:
+            if _DEBUG:
+                logger.debug("Could not determine effective temperature for %s: %s", model_name, e)
             # If we can't get capabilities, return the requested temperature
             return requested_temperature
 
+        # Check if model supports temperature at all
+        if not capabilities.supports_temperature:
+            return None
+
+        # Let the constraint pick the nearest valid value (clamp for ranges, snap for discrete steps)
+        effective_temperature = capabilities.temperature_constraint.get_corrected_value(requested_temperature)
+        if _DEBUG and effective_temperature != requested_temperature:
+            logger.debug(
+                "Adjusting temperature from %s to %s for model %s",
+                requested_temperature,
+                effective_temperature,
+                model_name,
+            )
+        return effective_temperature
+
     def validate_parameters(self, model_name: str, temperature: float, **kwargs) -> None:
         """Validate model parameters against capabilities.
 
         Raises:
             ValueError: If parameters are invalid
         """
-        capabilities = self.get_capabilities(model_name)
+        capabilities = self._get_capabilities_cached(model_name)
 
-        # Validate temperature
-        min_temp, max_temp = capabilities.temperature_range
-        if not min_temp <= temperature <= max_temp:
-            raise ValueError(f"Temperature {temperature} out of range [{min_temp}, {max_temp}] for model {model_name}")
+        # Validate temperature against the model's own constraint
+        constraint = capabilities.temperature_constraint
+        if not constraint.validate(temperature):
+            raise ValueError(
+                f"Temperature {temperature} invalid for model {model_name}: {constraint.get_description()}"
+            )
 
     @abstractmethod
     def supports_thinking_mode(self, model_name: str) -> bool:
@@ -313,10 +427,8 @@ class ModelProvider(ABC):
         Returns:
             Dictionary mapping model names to their ModelCapabilities objects
         """
-        # Return SUPPORTED_MODELS if it exists (must contain ModelCapabilities objects)
-        if hasattr(self, "SUPPORTED_MODELS"):
-            return {k: v for k, v in self.SUPPORTED_MODELS.items() if isinstance(v, ModelCapabilities)}
-        return {}
+        # SUPPORTED_MODELS is declared on ModelProvider, so it is always present (must contain ModelCapabilities objects)
+        return {k: v for k, v in self.SUPPORTED_MODELS.items() if isinstance(v, ModelCapabilities)}
 
     def get_all_model_aliases(self) -> dict[str, list[str]]:
         """Get all model aliases for this provider.
@@ -338,7 +450,9 @@ class ModelProvider(ABC):
         """Resolve model shorthand to full name.
 
         This implementation uses the hook methods to support different
-        model configuration sources.
+        model configuration sources. Results are memoized per instance in a
+        bounded LRU cache since the configurations are static for the lifetime
+        of a provider.
 
         Args:
             model_name: Model name that may be an alias
@@ -346,6 +460,10 @@ class ModelProvider(ABC):
         Returns:
             Resolved model name
         """
+        return self._resolved_name_cache(model_name)
+
+    def _lookup_model_name(self, model_name: str) -> str:
+        """Resolve model shorthand to full name without caching."""
         # Get model configurations from the hook method
         model_configs = self.get_model_configurations()
 
@@ -384,13 +502,16 @@ class ModelProvider(ABC):
         """
         from utils.model_restrictions import get_restriction_service
 
+        # Only the configuration walk is cached; restrictions come from a global service
+        # that can be reinitialised, so they are applied on every call
+        if self._model_listing_cache is None:
+            self._model_listing_cache = (list(self.get_model_configurations()), self.get_all_model_aliases())
+        model_names, all_aliases = self._model_listing_cache
+
         restriction_service = get_restriction_service() if respect_restrictions else None
         models = []
 
-        # Get model configurations from the hook method
-        model_configs = self.get_model_configurations()
-
-        for model_name in model_configs:
+        for model_name in model_names:
             # Check restrictions if enabled
             if restriction_service and not restriction_service.is_allowed(self.get_provider_type(), model_name):
                 continue
@@ -398,8 +519,6 @@ class ModelProvider(ABC):
             # Add the base model
             models.append(model_name)
 
-        # Get aliases from the hook method
-        all_aliases = self.get_all_model_aliases()
         for model_name, aliases in all_aliases.items():
             # Only add aliases for models that passed restriction check
             if model_name in models:
@@ -416,6 +535,12 @@ class ModelProvider(ABC):
         Returns:
             List of all model names and alias targets known by this provider
         """
+        if self._list_all_cache is None:
+            self._list_all_cache = self._compute_list_all_known_models()
+        return list(self._list_all_cache)
+
+    def _compute_list_all_known_models(self) -> list[str]:
+        """Build the list returned by list_all_known_models() without caching."""
         all_models = set()
 
         # Get model configurations from the hook method
@@ -433,6 +558,21 @@ class ModelProvider(ABC):
 
         return list(all_models)
 
+    def invalidate_model_cache(self) -> None:
+        """Clear memoized model listings and lookups.
+
+        The caches assume the model configuration is fixed for the provider's
+        lifetime, and no code path in this repo reloads it in place. Restriction
+        changes need no call here: cached capabilities are dropped when the
+        restriction policy changes, and list_models() filters on every call.
+        Call this only if an existing instance's model configuration is reloaded.
+        """
+        self._known_names = frozenset(self.SUPPORTED_MODELS)
+        self._capabilities_cache.cache_clear()
+        self._resolved_name_cache.cache_clear()
+        self._model_listing_cache = None
+        self._list_all_cache = None
+
     def close(self):
         """Clean up any resources held by the provider.
 
@@ -8,7 +8,7 @@ from .base import (
     ModelCapabilities,
     ModelResponse,
     ProviderType,
-    RangeTemperatureConstraint,
+    create_temperature_constraint,
 )
 from .openai_compatible import OpenAICompatibleProvider
 from .openrouter_registry import OpenRouterModelRegistry
@@ -164,7 +164,7 @@ class CustomProvider(OpenAICompatibleProvider):
                 supports_streaming=True,
                 supports_function_calling=False,  # Conservative default
                 supports_temperature=True,  # Most custom models accept temperature parameter
-                temperature_constraint=RangeTemperatureConstraint(0.0, 2.0, 0.7),
+                temperature_constraint=create_temperature_constraint("range"),
             )
 
             # Mark as generic for validation purposes
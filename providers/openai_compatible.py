@@ -604,10 +604,10 @@ class OpenAICompatibleProvider(ModelProvider):
             **kwargs: Additional parameters to validate
         """
         try:
-            capabilities = self.get_capabilities(model_name)
+            capabilities = self._get_capabilities_cached(model_name)
 
             # Check if we're using generic capabilities
-            if hasattr(capabilities, "_is_generic"):
+            if getattr(capabilities, "_is_generic", False):
                 logging.debug(
                     f"Using generic parameter validation for {model_name}. Actual model constraints may differ."
                 )
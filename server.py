@@ -362,7 +362,7 @@ def configure_providers():
         ValueError: If no valid API keys are found or conflicting configurations detected
     """
     from providers import ModelProviderRegistry
-    from providers.base import ProviderType
+    from providers.base import ProviderType, refresh_log_level
     from providers.custom import CustomProvider
     from providers.dial import DIALModelProvider
     from providers.gemini import GeminiModelProvider
@@ -371,6 +371,9 @@ def configure_providers():
     from providers.xai import XAIModelProvider
     from utils.model_restrictions import get_restriction_service
 
+    # Providers were imported before logging was configured; pick up the active log level
+    refresh_log_level()
+
     valid_providers = []
     has_native_apis = False
     has_openrouter = False
@@ -66,6 +66,15 @@ class TestOpenRouterProvider:
         assert caps.context_window == 32_768  # Safe default
         assert hasattr(caps, "_is_generic") and caps._is_generic is True
 
+    def test_generic_capabilities_cache_is_bounded(self):
+        """Test generic capabilities for arbitrary model names cannot grow the cache without limit."""
+        provider = OpenRouterProvider(api_key="test-key")
+
+        for i in range(500):
+            assert provider._get_capabilities_cached(f"unknown/model-{i}")._is_generic is True
+
+        assert provider._capabilities_cache.cache_info().currsize <= 64
+
     def test_model_alias_resolution(self):
         """Test model alias resolution."""
         provider = OpenRouterProvider(api_key="test-key")
@@ -1,12 +1,22 @@
 """Tests for the model provider abstraction system"""
 
+import copy
 import os
+import pickle
 from unittest.mock import Mock, patch
 
 import pytest
 
 from providers import ModelProviderRegistry, ModelResponse
-from providers.base import ProviderType
+from providers.base import (
+    DiscreteTemperatureConstraint,
+    FixedTemperatureConstraint,
+    ModelCapabilities,
+    ModelProvider,
+    ProviderType,
+    RangeTemperatureConstraint,
+    create_temperature_constraint,
+)
 from providers.gemini import GeminiModelProvider
 from providers.openai_provider import OpenAIModelProvider
 
@@ -120,6 +130,57 @@ class TestGeminiProvider:
         capabilities = provider.get_capabilities("flash")
         assert capabilities.model_name == "gemini-2.5-flash"
 
+    def test_capabilities_cached_for_temperature_paths(self):
+        """Test temperature helpers only look up capabilities once per model"""
+        provider = GeminiModelProvider(api_key="test-key")
+
+        with patch.object(provider, "get_capabilities", wraps=provider.get_capabilities) as mock_get:
+            assert provider.get_effective_temperature("flash", 0.5) == 0.5
+            provider.validate_parameters("flash", 0.5)
+            provider.validate_parameters("flash", 1.0)
+
+        assert mock_get.call_count == 1
+
+    def test_cached_capabilities_respect_new_restrictions(self):
+        """Test a rebuilt restriction service is enforced for previously cached models"""
+        import utils.model_restrictions
+
+        provider = GeminiModelProvider(api_key="test-key")
+        utils.model_restrictions._restriction_service = None
+        try:
+            with patch.dict(os.environ, {"GOOGLE_ALLOWED_MODELS": ""}):
+                provider.validate_parameters("pro", 0.5)
+
+            with patch.dict(os.environ, {"GOOGLE_ALLOWED_MODELS": "flash"}):
+                utils.model_restrictions._restriction_service = None
+                with pytest.raises(ValueError, match="not allowed by restriction policy"):
+                    provider.validate_parameters("pro", 0.5)
+        finally:
+            utils.model_restrictions._restriction_service = None
+
+    def test_model_name_resolution_cached(self):
+        """Test alias resolution is cached per model name"""
+        provider = GeminiModelProvider(api_key="test-key")
+
+        with patch.object(
+            provider, "get_model_configurations", wraps=provider.get_model_configurations
+        ) as mock_configs:
+            assert provider._resolve_model_name("Flash") == "gemini-2.5-flash"
+            first_call_count = mock_configs.call_count
+            assert provider._resolve_model_name("Flash") == "gemini-2.5-flash"
+
+        assert first_call_count > 0
+        assert mock_configs.call_count == first_call_count
+
+    def test_model_name_resolution_cache_is_bounded(self):
+        """Test arbitrary client-supplied names cannot grow the resolution cache without limit"""
+        provider = GeminiModelProvider(api_key="test-key")
+
+        for i in range(500):
+            assert provider._resolve_model_name(f"unknown-model-{i}") == f"unknown-model-{i}"
+
+        assert provider._resolved_name_cache.cache_info().currsize <= 64
+
     def test_supports_thinking_mode(self):
         """Test thinking mode support detection"""
         provider = GeminiModelProvider(api_key="test-key")
@@ -157,6 +218,7 @@ class TestGeminiProvider:
         assert response.usage["input_tokens"] == 10
         assert response.usage["output_tokens"] == 20
         assert response.usage["total_tokens"] == 30
+        assert response.total_tokens == 30
 
 
 class TestOpenAIProvider:
@@ -228,3 +290,207 @@ class TestOpenAIProvider:
         assert not provider.supports_thinking_mode("o3-mini")
         assert not provider.supports_thinking_mode("o4-mini")
         assert not provider.supports_thinking_mode("o4-mini")
+
+
+class TestTemperatureConstraints:
+    """Test temperature constraint implementations"""
+
+    def test_discrete_constraint_validate(self):
+        """Test discrete constraint accepts only allowed values"""
+        constraint = DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0, 1.5, 2.0], 0.7)
+
+        assert constraint.validate(0.3)
+        assert constraint.validate(0.1 + 0.2)  # Floating point noise is tolerated
+        assert constraint.validate(2.0)
+        assert not constraint.validate(0.5)
+        assert not constraint.validate(2.5)
+
+    def test_discrete_constraint_validate_edge_values(self):
+        """Test discrete constraint validation returns False for extreme values and keeps its tolerance"""
+        constraint = DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0, 1.5, 2.0], 0.7)
+
+        assert constraint.validate(0.3000008)  # Within the 1e-6 tolerance
+        assert not constraint.validate(0.300002)
+        assert not constraint.validate(1e303)
+        assert not constraint.validate(float("inf"))
+        assert not constraint.validate(float("-inf"))
+        assert not constraint.validate(float("nan"))
+
+    def test_discrete_constraint_corrected_value(self):
+        """Test discrete constraint snaps to the nearest allowed value"""
+        constraint = DiscreteTemperatureConstraint([1.0, 0.0, 2.0, 0.3, 0.7, 1.5], 0.7)
+
+        assert constraint.get_corrected_value(-1.0) == 0.0
+        assert constraint.get_corrected_value(0.1) == 0.0
+        assert constraint.get_corrected_value(0.2) == 0.3
+        assert constraint.get_corrected_value(0.7) == 0.7
+        assert constraint.get_corrected_value(1.2) == 1.0
+        assert constraint.get_corrected_value(1.3) == 1.5
+        assert constraint.get_corrected_value(3.0) == 2.0
+
+    def test_discrete_constraint_default_from_sorted_values(self):
+        """Test discrete constraint picks its fallback default from the sorted values"""
+        constraint = DiscreteTemperatureConstraint([2.0, 0.0, 1.0])
+
+        assert constraint.allowed_values == (0.0, 1.0, 2.0)
+        assert constraint.get_default() == 1.0
+        assert DiscreteTemperatureConstraint([0.0, 1.0], 0.0).get_default() == 0.0
+
+    def test_shared_constraints_are_immutable(self):
+        """Test shared constraint instances cannot be modified in place"""
+        for constraint_type in ("fixed", "range", "discrete"):
+            constraint = create_temperature_constraint(constraint_type)
+            with pytest.raises(AttributeError):
+                constraint.default_temp = 0.1
+            with pytest.raises(AttributeError):
+                del constraint.default_temp
+
+        assert create_temperature_constraint("range").get_default() == 0.7
+
+        # Immutability must not break copying or pickling, including via ModelCapabilities
+        for constraint_type in ("fixed", "range", "discrete"):
+            constraint = create_temperature_constraint(constraint_type)
+            for clone in (
+                copy.copy(constraint),
+                copy.deepcopy(constraint),
+                pickle.loads(pickle.dumps(constraint)),
+            ):
+                assert type(clone) is type(constraint)
+                assert clone.get_range() == constraint.get_range()
+                assert clone.get_default() == constraint.get_default()
+                assert clone.get_description() == constraint.get_description()
+
+        capabilities = ModelCapabilities(
+            provider=ProviderType.GOOGLE,
+            model_name="test-model",
+            friendly_name="Gemini",
+            context_window=32_768,
+            max_output_tokens=8192,
+            temperature_constraint=create_temperature_constraint("discrete"),
+        )
+        for clone in (copy.deepcopy(capabilities), pickle.loads(pickle.dumps(capabilities))):
+            assert clone.model_name == "test-model"
+            assert clone.temperature_range == (0.0, 2.0)
+            assert clone.temperature_constraint.get_corrected_value(0.4) == 0.3
+
+    def test_constraint_ranges(self):
+        """Test each constraint reports its range and capabilities expose it"""
+        assert FixedTemperatureConstraint(1.0).get_range() == (1.0, 1.0)
+        assert RangeTemperatureConstraint(0.0, 1.5).get_range() == (0.0, 1.5)
+        assert DiscreteTemperatureConstraint([1.0, 0.3, 0.0]).get_range() == (0.0, 1.0)
+
+        capabilities = ModelCapabilities(
+            provider=ProviderType.GOOGLE,
+            model_name="test-model",
+            friendly_name="Gemini",
+            context_window=32_768,
+            max_output_tokens=8192,
+            temperature_constraint=FixedTemperatureConstraint(1.0),
+        )
+        assert capabilities.temperature_range == (1.0, 1.0)
+
+        # Reassigning the constraint is reflected immediately
+        capabilities.temperature_constraint = RangeTemperatureConstraint(0.0, 1.5)
+        assert capabilities.temperature_range == (0.0, 1.5)
+
+    def test_validate_parameters_uses_discrete_constraint(self):
+        """Test parameter validation rejects values between discrete steps"""
+        provider = GeminiModelProvider(api_key="test-key")
+        capabilities = ModelCapabilities(
+            provider=ProviderType.GOOGLE,
+            model_name="discrete-model",
+            friendly_name="Gemini",
+            context_window=32_768,
+            max_output_tokens=8192,
+            temperature_constraint=DiscreteTemperatureConstraint([0.0, 0.3, 0.7, 1.0], 0.7),
+        )
+
+        with patch.object(provider, "get_capabilities", return_value=capabilities):
+            provider.validate_parameters("discrete-model", 0.3)
+            with pytest.raises(ValueError, match="Supports temperatures"):
+                provider.validate_parameters("discrete-model", 0.5)
+
+            # The effective temperature must always pass validation
+            for requested in (0.5, 0.85, -1.0, 3.0):
+                effective = provider.get_effective_temperature("discrete-model", requested)
+                assert effective in (0.0, 0.3, 0.7, 1.0)
+                provider.validate_parameters("discrete-model", effective)
+
+
+class TestModelProviderDefaults:
+    """Test default implementations on the ModelProvider base class"""
+
+    def _make_provider(self):
+        class MinimalProvider(ModelProvider):
+            SUPPORTED_MODELS = {
+                "base-model": ModelCapabilities(
+                    provider=ProviderType.CUSTOM,
+                    model_name="base-model",
+                    friendly_name="Minimal",
+                    context_window=8192,
+                    max_output_tokens=4096,
+                    aliases=["short"],
+                )
+            }
+
+            def get_capabilities(self, model_name):
+                return self.SUPPORTED_MODELS[self._resolve_model_name(model_name)]
+
+            def generate_content(self, prompt, model_name, **kwargs):
+                raise NotImplementedError
+
+            def count_tokens(self, text, model_name):
+                return len(text)
+
+            def get_provider_type(self):
+                return ProviderType.CUSTOM
+
+            def supports_thinking_mode(self, model_name):
+                return False
+
+        return MinimalProvider(api_key="test-key")
+
+    def test_default_validate_model_name(self):
+        """Test default model name validation handles base names and aliases"""
+        provider = self._make_provider()
+
+        assert provider.validate_model_name("base-model")
+        assert provider.validate_model_name("short")
+        assert provider.validate_model_name("SHORT")
+        assert not provider.validate_model_name("unknown-model")
+
+    def test_model_listings_cached_until_invalidated(self):
+        """Test model listings are memoized and refreshed by invalidate_model_cache"""
+        provider = self._make_provider()
+
+        assert sorted(provider.list_models(respect_restrictions=False)) == ["base-model", "short"]
+        assert sorted(provider.list_all_known_models()) == ["base-model", "short"]
+
+        with patch.object(provider, "get_model_configurations", return_value={}):
+            # Cached results are served without consulting the configuration hook
+            assert sorted(provider.list_models(respect_restrictions=False)) == ["base-model", "short"]
+            assert sorted(provider.list_all_known_models()) == ["base-model", "short"]
+
+            provider.invalidate_model_cache()
+            assert provider.list_models(respect_restrictions=False) == []
+            assert provider.list_all_known_models() == []
+
+    def test_list_models_applies_current_restrictions(self):
+        """Test cached listings still honour a replaced restriction service"""
+        provider = self._make_provider()
+        allow_all = Mock()
+        allow_all.is_allowed.return_value = True
+        deny_all = Mock()
+        deny_all.is_allowed.return_value = False
+
+        with patch("utils.model_restrictions.get_restriction_service", return_value=allow_all):
+            assert sorted(provider.list_models()) == ["base-model", "short"]
+        with patch("utils.model_restrictions.get_restriction_service", return_value=deny_all):
+            assert provider.list_models() == []
+
+    def test_effective_temperature_for_unknown_model(self):
+        """Test unknown models fall back to the requested temperature"""
+        provider = self._make_provider()
+
+        assert provider.get_effective_temperature("base-model", 3.0) == 2.0
+        assert provider.get_effective_temperature("unknown-model", 3.0) == 3.0